@@ -0,0 +1,291 @@
+import numpy as np  # Import numpy for numerical operations.
+
+try:
+    import numba  # Numba is optional; the 'numba' backend is only registered when it is installed.
+except ImportError:
+    numba = None
+
+# Registry mapping backend names to backend classes.
+_BACKENDS = {}
+
+
+def register_backend(name):
+    """
+    Register a compute backend class under the given name.
+    """
+    def decorator(cls):
+        _BACKENDS[name] = cls
+        return cls
+    return decorator
+
+
+def available_backends():
+    """
+    Return the names of all registered compute backends.
+    """
+    return sorted(_BACKENDS)
+
+
+def get_backend(name):
+    """
+    Create an instance of the compute backend registered under the given name.
+    """
+    try:
+        return _BACKENDS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown compute backend '{name}'. "
+                         f"Available backends: {', '.join(available_backends())}") from None
+
+
+def consume_food(positions, foods):
+    """
+    Let every agent within a food's radius consume one unit of it, as long as units remain.
+    """
+    for food in foods:
+        if food.count_resource_units > 0:
+            distances = np.linalg.norm(positions - food.position, axis=1)  # Distance of each agent to the food.
+            n_consumers = np.count_nonzero(distances < food.food_radius)  # Agents close enough to consume.
+            for _ in range(min(n_consumers, food.count_resource_units)):
+                food.consume()
+
+
+@register_backend('reference')
+class ReferenceBackend:
+    """
+    Per-Agent implementation kept as the correctness reference for the other backends.
+    """
+    def step(self, swarm, foods):
+        return swarm.reference_step(foods)
+
+
+class ArrayBackend:
+    """
+    Base class for backends that advance the swarm with a kernel working on NumPy arrays.
+
+    The agents' positions and directions are gathered into arrays, advanced by one step with
+    the kernel and written back to the agents. The per-agent zone accumulators (d_r, d_o, d_a,
+    n_r, n_o, n_a, d_p) are only maintained by the reference backend.
+    """
+    def kernel(self, positions, directions, speeds, theta_max, noise, predator_position, has_predator,
+               rep_r, orien_r, attr_r, pred_r, dt, space_size):
+        raise NotImplementedError
+
+    def step(self, swarm, foods):
+        agents = swarm.agents
+        positions = np.array([agent.position for agent in agents], dtype=float)
+        directions = np.array([agent.unit_dir_vec for agent in agents], dtype=float)
+        speeds = np.array([agent.speed for agent in agents], dtype=float)
+        theta_max = np.array([agent.theta_max for agent in agents], dtype=float)
+
+        # Food is consumed from the positions at the start of the step, before any agent moves.
+        consume_food(positions, foods)
+
+        # One noise sample per agent, drawn in agent order like the reference backend.
+        noise = np.asarray(swarm.generate_noise(swarm.sigma, len(agents)), dtype=float)
+
+        # Only the predator-based swarm has a predator.
+        predator = getattr(swarm, 'predator', None)
+        if predator is None:
+            predator_position, has_predator, pred_r = np.zeros(2), False, 0.0
+        else:
+            predator_position = np.asarray(predator.position, dtype=float)
+            has_predator, pred_r = True, float(swarm.predator_radius)
+
+        positions, directions, desire = self.kernel(positions, directions, speeds, theta_max, noise,
+                                                    predator_position, has_predator,
+                                                    float(swarm.repul_radius), float(swarm.orien_radius),
+                                                    float(swarm.attrac_radius), pred_r,
+                                                    float(swarm.dt), float(swarm.space_size))
+
+        # Write the new state back to the agents.
+        for i, agent in enumerate(agents):
+            agent.position[:] = positions[i]
+            agent.unit_dir_vec = directions[i]
+            agent.desire_direction = desire[i]
+
+        # Check if all food resources have been consumed.
+        return all(food.count_resource_units <= 0 for food in foods)
+
+
+def _normalize_rows(vectors):
+    """
+    Normalize each row to unit length, leaving zero-length rows untouched.
+    """
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, norms, out=vectors.copy(), where=norms != 0)
+
+
+@register_backend('numpy')
+class NumpyBackend(ArrayBackend):
+    """
+    Vectorized backend computing all pairwise interactions at once with NumPy.
+    """
+    def kernel(self, positions, directions, speeds, theta_max, noise, predator_position, has_predator,
+               rep_r, orien_r, attr_r, pred_r, dt, space_size):
+        n = len(positions)
+
+        # Pairwise vectors r_ij = c_j - c_i, their lengths and unit vectors.
+        offsets = positions[np.newaxis, :, :] - positions[:, np.newaxis, :]
+        distances = np.linalg.norm(offsets, axis=2)
+        interacting = distances != 0
+        unit_offsets = np.divide(offsets, distances[:, :, np.newaxis], out=np.zeros_like(offsets),
+                                 where=interacting[:, :, np.newaxis])
+
+        # Agents that perceive the predator ignore their neighbors.
+        if has_predator:
+            predator_distances = np.linalg.norm(predator_position - positions, axis=1)
+            interacting &= (predator_distances >= pred_r)[:, np.newaxis]
+
+        # Zone membership of each neighbor j for each agent i.
+        zor = interacting & (distances < rep_r)
+        zoo = interacting & (distances >= rep_r) & (distances < orien_r)
+        zoa = interacting & (distances >= orien_r) & (distances < attr_r)
+        n_r = np.count_nonzero(zor, axis=1)
+        n_o = np.count_nonzero(zoo, axis=1)
+        n_a = np.count_nonzero(zoa, axis=1)
+        no_neighbors = (n_r == 0) & (n_o == 0) & (n_a == 0)
+
+        # Agents without neighbors head along their noisy current direction. The reference backend
+        # updates their direction in place, so agents later in the order already see the new heading
+        # when they align with them.
+        free_directions = _normalize_rows(directions + noise[:, np.newaxis])
+        updated_earlier = np.tri(n, k=-1, dtype=bool) & no_neighbors[np.newaxis, :]
+
+        d_r = np.einsum('ij,ijk->ik', zor, unit_offsets)
+        d_o = zoo @ directions + (zoo & updated_earlier) @ (free_directions - directions)
+        d_o /= (n_o + 1)[:, np.newaxis]
+        d_a = np.einsum('ij,ijk->ik', zoa, unit_offsets)
+
+        # Desired direction from the zones, with the same precedence as Agent.evaluate_desire_direction.
+        desire = np.where((n_r > 0)[:, np.newaxis], -d_r,
+                 np.where(((n_o > 0) & (n_a > 0))[:, np.newaxis], (d_o + d_a) * 0.5,
+                 np.where((n_o > 0)[:, np.newaxis], d_o,
+                 np.where((n_a > 0)[:, np.newaxis], d_a, directions))))
+        desire = _normalize_rows(desire + noise[:, np.newaxis])
+        current = np.where(no_neighbors[:, np.newaxis], free_directions, directions)
+
+        # Turn towards the desired direction by at most theta_max.
+        unit_v1 = current / np.linalg.norm(current, axis=1, keepdims=True)
+        unit_v2 = desire / np.linalg.norm(desire, axis=1, keepdims=True)
+        angle = np.arccos(np.clip(np.sum(unit_v1 * unit_v2, axis=1), -1.0, 1.0))
+        sign = np.sign(current[:, 0] * desire[:, 1] - current[:, 1] * desire[:, 0])
+        turn_angle = sign * np.minimum(angle, theta_max)
+        cos_t, sin_t = np.cos(turn_angle), np.sin(turn_angle)
+        rotated = np.stack((cos_t * current[:, 0] - sin_t * current[:, 1],
+                            sin_t * current[:, 0] + cos_t * current[:, 1]), axis=1)
+        directions = rotated / np.linalg.norm(rotated, axis=1, keepdims=True)
+
+        # Move and wrap around the boundaries of the space.
+        positions = positions + directions * (speeds * dt)[:, np.newaxis]
+        positions = np.where(positions > space_size, 0.0, np.where(positions < 0.0, space_size, positions))
+        return positions, directions, desire
+
+
+def _loop_kernel(positions, directions, speeds, theta_max, noise, predator_position, has_predator,
+                 rep_r, orien_r, attr_r, pred_r, dt, space_size):
+    """
+    Explicit-loop version of the reference step, written for compilation with Numba.
+    """
+    n = positions.shape[0]
+    directions = directions.copy()
+    desire = np.empty_like(directions)
+
+    for i in range(n):
+        x_i, y_i = positions[i, 0], positions[i, 1]
+        d_r_x = d_r_y = d_o_x = d_o_y = d_a_x = d_a_y = 0.0
+        n_r = n_o = n_a = 0
+
+        # Agents that perceive the predator ignore their neighbors.
+        detected = False
+        if has_predator:
+            r_ip_x, r_ip_y = predator_position[0] - x_i, predator_position[1] - y_i
+            detected = np.sqrt(r_ip_x * r_ip_x + r_ip_y * r_ip_y) < pred_r
+
+        if not detected:
+            for j in range(n):
+                r_ij_x, r_ij_y = positions[j, 0] - x_i, positions[j, 1] - y_i
+                distance = np.sqrt(r_ij_x * r_ij_x + r_ij_y * r_ij_y)
+                if distance != 0:
+                    r_ij_x /= distance
+                    r_ij_y /= distance
+                    if distance < rep_r:
+                        n_r += 1
+                        d_r_x += r_ij_x
+                        d_r_y += r_ij_y
+                    elif distance < orien_r:
+                        n_o += 1
+                        d_o_x += directions[j, 0]
+                        d_o_y += directions[j, 1]
+                    elif distance < attr_r:
+                        n_a += 1
+                        d_a_x += r_ij_x
+                        d_a_y += r_ij_y
+
+        if n_o > 0:
+            d_o_x /= (n_o + 1)
+            d_o_y /= (n_o + 1)
+
+        if n_r > 0:
+            d_x, d_y = -d_r_x, -d_r_y
+        elif n_o > 0 and n_a > 0:
+            d_x, d_y = (d_o_x + d_a_x) * 0.5, (d_o_y + d_a_y) * 0.5
+        elif n_o > 0:
+            d_x, d_y = d_o_x, d_o_y
+        elif n_a > 0:
+            d_x, d_y = d_a_x, d_a_y
+        else:
+            d_x, d_y = directions[i, 0], directions[i, 1]
+
+        d_x += noise[i]
+        d_y += noise[i]
+        norm = np.sqrt(d_x * d_x + d_y * d_y)
+        if norm != 0:
+            d_x /= norm
+            d_y /= norm
+        desire[i, 0], desire[i, 1] = d_x, d_y
+
+        # Without neighbors the reference backend updates the direction itself in place.
+        if n_r == 0 and n_o == 0 and n_a == 0:
+            directions[i, 0], directions[i, 1] = d_x, d_y
+
+    new_positions = np.empty_like(positions)
+    new_directions = np.empty_like(directions)
+    for i in range(n):
+        u_x, u_y = directions[i, 0], directions[i, 1]
+        v_x, v_y = desire[i, 0], desire[i, 1]
+
+        # Turn towards the desired direction by at most theta_max.
+        u_norm = np.sqrt(u_x * u_x + u_y * u_y)
+        v_norm = np.sqrt(v_x * v_x + v_y * v_y)
+        cos_theta = min(max((u_x * v_x + u_y * v_y) / (u_norm * v_norm), -1.0), 1.0)
+        angle = np.arccos(cos_theta)
+        cross = u_x * v_y - u_y * v_x
+        sign = 1.0 if cross > 0 else (-1.0 if cross < 0 else 0.0)
+        turn_angle = sign * min(angle, theta_max[i])
+        cos_t, sin_t = np.cos(turn_angle), np.sin(turn_angle)
+        r_x, r_y = cos_t * u_x - sin_t * u_y, sin_t * u_x + cos_t * u_y
+        r_norm = np.sqrt(r_x * r_x + r_y * r_y)
+        new_directions[i, 0], new_directions[i, 1] = r_x / r_norm, r_y / r_norm
+
+        # Move and wrap around the boundaries of the space.
+        for k in range(2):
+            p = positions[i, k] + new_directions[i, k] * speeds[i] * dt
+            if p > space_size:
+                p = 0.0
+            elif p < 0.0:
+                p = space_size
+            new_positions[i, k] = p
+
+    return new_positions, new_directions, desire
+
+
+if numba is not None:
+    _numba_kernel = numba.njit(_loop_kernel)
+
+    @register_backend('numba')
+    class NumbaBackend(ArrayBackend):
+        """
+        Backend running the explicit-loop kernel compiled with Numba.
+        """
+        def kernel(self, *args):
+            return _numba_kernel(*args)
@@ -0,0 +1,96 @@
+import sys  # Import sys to report the result through the exit status.
+import matplotlib
+
+matplotlib.use('Agg')  # Run the simulations without opening a window.
+
+import numpy as np  # Import numpy for numerical operations.
+import matplotlib.pyplot as plt  # Import matplotlib to release the simulation figures.
+from backends import available_backends  # Import the compute backend registry.
+from hubirt_PAR import SimulationPAR  # Import the simulation class for parameter-based swarm
+from hubirt_PRED import SimulationPRED  # Import the simulation class for predator-based swarm
+
+
+def run_trajectory(PAR_MODE, backend, seed, max_steps, params):
+    """
+    Run a simulation headless with the given backend and return the agents' trajectory and completion step.
+    """
+    np.random.seed(seed)  # Every backend starts from the same random state.
+    if PAR_MODE:
+        sim = SimulationPAR(params['N'], params['speed'], params['space_size'], params['sigma'], params['r_rep'],
+                            params['r_ori'], params['r_att'], params['dt'], params['n_food'], params['res_unit'],
+                            backend=backend)
+    else:
+        sim = SimulationPRED(params['N'], params['speed'], params['space_size'], params['sigma'], params['r_rep'],
+                             params['r_ori'], params['r_att'], params['r_pred'], params['dt'], params['n_food'],
+                             params['res_unit'], backend=backend)
+    plt.close(sim.fig)
+
+    trajectory = [np.array([agent.position for agent in sim.swarm.agents])]
+    completion_step = None
+    for step in range(1, max_steps + 1):
+        all_resources_consumed = sim.swarm.simulate(sim.foods)
+        if not PAR_MODE:
+            # Steer the predator towards its (fixed) target as SimulationPRED.animate does.
+            sim.swarm.predator.move_towards_point(sim.mouse_position, sim.swarm.dt, sim.swarm.space_size)
+        trajectory.append(np.array([agent.position for agent in sim.swarm.agents]))
+        if all_resources_consumed:
+            completion_step = step
+            break
+
+    return np.array(trajectory), completion_step
+
+
+def check_conformance(PAR_MODE, seed, max_steps, params, atol=1e-6):
+    """
+    Run every registered backend from one seed and compare it with the reference backend.
+
+    Returns a dictionary mapping each backend name to a tuple (conforms, max_deviation, completion_step).
+    """
+    reference, reference_completion = run_trajectory(PAR_MODE, 'reference', seed, max_steps, params)
+    results = {'reference': (True, 0.0, reference_completion)}
+
+    for backend in available_backends():
+        if backend == 'reference':
+            continue
+        trajectory, completion_step = run_trajectory(PAR_MODE, backend, seed, max_steps, params)
+        if trajectory.shape != reference.shape:
+            # Backends finishing at different steps cannot be compared position by position.
+            results[backend] = (False, np.inf, completion_step)
+            continue
+        # Compare positions on the torus so that a wrap-around at the boundary is not a deviation.
+        deviation = np.abs(trajectory - reference)
+        deviation = np.minimum(deviation, params['space_size'] - deviation)
+        max_deviation = float(deviation.max())
+        conforms = max_deviation <= atol and completion_step == reference_completion
+        results[backend] = (conforms, max_deviation, completion_step)
+
+    return results
+
+
+def main():
+    # Conformance parameters, matching the first simulation of hubirt_main.py
+    seeds = [0, 1, 2]  # Seeds to run every backend from
+    max_steps = 3000  # Maximum number of steps per run
+    atol = 1e-6  # Tolerance on the agents' positions
+    params = dict(N=30, speed=1.0, space_size=120, sigma=0.1, r_rep=5, r_ori=30, r_att=32, r_pred=35, dt=0.1,
+                  n_food=2, res_unit=1)
+
+    all_conform = True
+    for PAR_MODE in (True, False):
+        mode = 'PAR' if PAR_MODE else 'PRED'
+        for seed in seeds:
+            results = check_conformance(PAR_MODE, seed, max_steps, params, atol)
+            for backend, (conforms, max_deviation, completion_step) in results.items():
+                status = 'OK' if conforms else 'MISMATCH'
+                print(f'{mode} seed {seed} {backend:<10} completion step: {completion_step}, '
+                      f'max deviation: {max_deviation:.2e} [{status}]')
+                all_conform = all_conform and conforms
+
+    print(f'==========================================================')
+    print('All backends conform to the reference.' if all_conform else 'Some backends deviate from the reference.')
+    return 0 if all_conform else 1
+
+
+# Driver code
+if __name__ == "__main__":
+    sys.exit(main())
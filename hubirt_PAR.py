@@ -5,9 +5,10 @@ import matplotlib.pyplot as plt  # Import matplotlib for plotting.
 import matplotlib.animation as animation  # Import animation module for creating animated plots.
 from agent import Agent  # Import the Agent class from a custom module.
 from food import Food  # Import the Food class from a custom module.
+from backends import get_backend  # Import the compute backend registry.
 
 class Swarm:
-    def __init__(self, N, speed, space_size, sigma, rep_r, orien_r, attr_r, dt):
+    def __init__(self, N, speed, space_size, sigma, rep_r, orien_r, attr_r, dt, backend='reference'):
         """
         Initialize the Swarm object with specified parameters.
         """
@@ -24,6 +25,9 @@ class Swarm:
         self.orien_radius = orien_r
         self.attrac_radius = attr_r
 
+        # Compute backend used to advance the swarm by one step.
+        self.backend = get_backend(backend)
+
     def _initialize_agent(self, N, speed):
         """
         Initialize agents with random positions near a source and random directions.
@@ -32,11 +36,11 @@ class Swarm:
         # Create a list of agents with random positions and directions.
         return [Agent(np.random.uniform(source[0] - 10, source[1] + 10, 2), np.random.rand() * 2 * np.pi, speed) for _ in range(N)]
 
-    def generate_noise(self, sigma):
+    def generate_noise(self, sigma, size=None):
         """
         Generate random noise for agent movement.
         """
-        return np.random.normal(0, sigma)
+        return np.random.normal(0, sigma, size)
 
     def reset_swarm(self):
         """
@@ -51,6 +55,12 @@ class Swarm:
             agent.n_o = 0  # Reset orientation neighbors count.
 
     def simulate(self, foods):
+        """
+        Simulate one step of the swarm's movement with the selected compute backend.
+        """
+        return self.backend.step(self, foods)
+
+    def reference_step(self, foods):
         """
         Simulate the swarm's movement and interaction with food sources.
         """
@@ -96,7 +106,7 @@ class Swarm:
 
 class SimulationPAR:
     def __init__(self, N=100, speed=2.0, space_size=100, sigma=0.1, rep_r=3, orien_r=7, attr_r= 12, dt=1.0, n_food=2, resource_units=5,
-                 filename='simulation_data.txt'):
+                 filename='simulation_data.txt', backend='reference'):
         """
         Initialize the simulation with swarm parameters and food sources.
         """
@@ -108,7 +118,7 @@ class SimulationPAR:
         self.ax.set_ylim(0, space_size)  # Set the y-axis limits.
 
         # Initialize the swarm with specified parameters.
-        self.swarm = Swarm(N, speed, space_size, sigma, rep_r, orien_r, attr_r, dt)
+        self.swarm = Swarm(N, speed, space_size, sigma, rep_r, orien_r, attr_r, dt, backend)
         # Scatter plot for the agents' positions and directions.
         self.scat = self.ax.quiver([agent.position[0] for agent in self.swarm.agents],
                                    [agent.position[1] for agent in self.swarm.agents],
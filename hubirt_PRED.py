@@ -6,10 +6,11 @@ import matplotlib.animation as animation  # Importing animation module for creat
 from agent import Agent  # Importing the Agent class
 from food import Food  # Importing the Food class
 from predator import Predator  # Importing the Predator class
+from backends import get_backend  # Importing the compute backend registry
 
 # Class to manage the swarm of agents
 class Swarm:
-    def __init__(self, N, speed, space_size, sigma, rep_r, orien_r, attr_r, pred_r, dt):
+    def __init__(self, N, speed, space_size, sigma, rep_r, orien_r, attr_r, pred_r, dt, backend='reference'):
         # Initialize swarm parameters
         self.num_agents = N  # Number of agents in the swarm
         self.dt = dt  # Time step for the simulation
@@ -27,6 +28,8 @@ class Swarm:
         self.orien_radius = orien_r  # Orientation radius between agents
         self.attrac_radius = attr_r  # Attraction radius between agents
 
+        self.backend = get_backend(backend)  # Compute backend used to advance the swarm
+
     @staticmethod
     def __initialize_agent(N, speed):
         # Initialize each agent at a random position near a source point with a random direction
@@ -34,9 +37,9 @@ class Swarm:
         return [Agent(np.random.uniform(source[0] - 10, source[1] + 10, 2),
                       np.random.rand() * 2 * np.pi, speed) for _ in range(N)]
 
-    def generate_noise(self, sigma):
+    def generate_noise(self, sigma, size=None):
         # Generate random noise to add stochastic behavior to the agents
-        return np.random.normal(0, sigma)
+        return np.random.normal(0, sigma, size)
 
     def reset_swarm(self):
         # Reset the forces and neighbor counts for each agent at the start of each simulation step
@@ -49,6 +52,10 @@ class Swarm:
             agent.n_o = 0  # Reset orientation neighbors count
 
     def simulate(self, foods):
+        # Simulate one step of the swarm's behavior with the selected compute backend
+        return self.backend.step(self, foods)
+
+    def reference_step(self, foods):
         # Simulate one step of the swarm's behavior
         self.reset_swarm()  # Reset the swarm's state
 
@@ -107,7 +114,8 @@ class Swarm:
 # Class to manage and run the simulation
 class SimulationPRED:
     def __init__(self, N=100, speed=2.0, space_size=100, sigma=0.1, rep_r=3, orien_r=7, attr_r=12,
-                 pred_r=15, dt=1.0, n_food=2, resource_units=5, filename='simulation_data.txt'):
+                 pred_r=15, dt=1.0, n_food=2, resource_units=5, filename='simulation_data.txt',
+                 backend='reference'):
         # Initialize simulation parameters
         self.start_time = None  # Start time of the simulation
         self.end_time = None  # End time of the simulation
@@ -119,7 +127,7 @@ class SimulationPRED:
         self.ax.set_ylim(0, space_size)
 
         # Initialize the swarm and plotting elements
-        self.swarm = Swarm(N, speed, space_size, sigma, rep_r, orien_r, attr_r, pred_r, dt)
+        self.swarm = Swarm(N, speed, space_size, sigma, rep_r, orien_r, attr_r, pred_r, dt, backend)
         self.scat = self.ax.quiver([agent.position[0] for agent in self.swarm.agents],
                                    [agent.position[1] for agent in self.swarm.agents],
                                    [agent.unit_dir_vec[0] for agent in self.swarm.agents],
@@ -22,6 +22,7 @@ def main():
     space_size = 120  # Size of the simulation space
     n_food = [2, 2, 10, 10]  # Number of food items in each simulation
     res_unit = [1, 10, 100, 200]  # Resource units associated with food items
+    backend = 'numpy'  # Compute backend: 'reference', 'numpy' or 'numba' (requires Numba)
 
     # Loop through the number of simulations
     for i in range(n_sim):
@@ -39,7 +40,7 @@ def main():
                 plot_filename = 'sim_completion_plot_PAR.png'  # Filename for the final plot
                 # Initialize the simulation with the current parameters
                 sim = SimulationPAR(N, speed, space_size, sigma, r_rep, r_ori, r_att, dt, n_food[i], res_unit[i],
-                                    data_filename)
+                                    data_filename, backend)
                 sim.run()  # Run the simulation
 
         # If in predator-based swarm mode
@@ -54,7 +55,7 @@ def main():
                 plot_filename = 'sim_completion_plot_PRED.png'  # Filename for the final plot
                 # Initialize the simulation with the current parameters, including predator radius
                 sim = SimulationPRED(N, speed, space_size, sigma, r_rep, r_ori, r_att, r_pred, dt, n_food[i],
-                                     res_unit[i], data_filename)
+                                     res_unit[i], data_filename, backend)
                 sim.run()  # Run the simulation
 
     print(f'==========================================================')